@@ -16,6 +16,7 @@ import i18next from 'i18next';
 import * as i18nextMiddleware from 'i18next-http-middleware';
 import passport from 'passport';
 import { StringEncryption } from './src/config/EncryptionService';
+import compression from './src/middleware/compression';
 
 import userRoutes from './src/routes/user/user';
 import apiRoutes, { languageRouter } from './src/routes/api/api';
@@ -136,11 +137,11 @@ const encryption = new StringEncryption();
 
     app.use('/api/auth', authRoutes);
     app.use('/api/user', userRoutes);
-    app.use('/api/services', servicesRoutes);
+    app.use('/api/services', compression(), servicesRoutes);
     app.use('/api/mappings', mappingsRoutes);
     app.use('/api/info', apiRoutes);
     app.use('/api/language', languageRouter);
-    app.use('/about.json', aboutRoutes);
+    app.use('/about.json', compression(), aboutRoutes);
     app.use('/api/webhooks', webhookRoutes);
 
     app.listen(3000, () => {
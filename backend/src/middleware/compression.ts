@@ -0,0 +1,114 @@
+import { Request, Response, NextFunction } from 'express';
+import zlib from 'zlib';
+
+type Encoding = 'br' | 'gzip';
+
+const SUPPORTED_ENCODINGS: Encoding[] = ['br', 'gzip'];
+const DEFAULT_THRESHOLD = 1024;
+
+export const negotiateEncoding = (
+  header: string | undefined
+): Encoding | null => {
+  if (!header) return null;
+
+  const accepted = new Map<string, number>();
+  for (const part of header.split(',')) {
+    const [rawName, ...params] = part.trim().split(';');
+    const name = rawName?.trim().toLowerCase();
+    if (!name) continue;
+    let quality = 1;
+    for (const param of params) {
+      const [key, value] = param.trim().split('=');
+      if (key === 'q' && value !== undefined) {
+        const parsed = parseFloat(value);
+        quality = isNaN(parsed) ? 0 : parsed;
+      }
+    }
+    accepted.set(name, quality);
+  }
+
+  let best: Encoding | null = null;
+  let bestQuality = 0;
+  for (const encoding of SUPPORTED_ENCODINGS) {
+    const quality = accepted.get(encoding) ?? accepted.get('*') ?? 0;
+    if (quality > bestQuality) {
+      best = encoding;
+      bestQuality = quality;
+    }
+  }
+  return best;
+};
+
+const stringify = (req: Request, data: unknown): string => {
+  const replacer = req.app.get('json replacer');
+  const spaces = req.app.get('json spaces');
+  const json = JSON.stringify(data, replacer, spaces) ?? '';
+  if (!req.app.get('json escape')) return json;
+  return json.replace(/[<>&]/g, char =>
+    char === '<' ? '\\u003c' : char === '>' ? '\\u003e' : '\\u0026'
+  );
+};
+
+const compressBody = (
+  body: Buffer,
+  encoding: Encoding,
+  callback: (err: Error | null, result: Buffer) => void
+): void => {
+  if (encoding === 'br') {
+    zlib.brotliCompress(
+      body,
+      {
+        params: {
+          [zlib.constants.BROTLI_PARAM_MODE]: zlib.constants.BROTLI_MODE_TEXT,
+          [zlib.constants.BROTLI_PARAM_QUALITY]: 5,
+          [zlib.constants.BROTLI_PARAM_SIZE_HINT]: body.length,
+        },
+      },
+      callback
+    );
+    return;
+  }
+  zlib.gzip(body, { level: 6 }, callback);
+};
+
+/**
+ * Compresses JSON responses with brotli or gzip according to the
+ * client's Accept-Encoding header. Bodies under `threshold` bytes are
+ * sent as is since the encoding overhead outweighs the gain.
+ * Compression runs on the zlib thread pool so it does not block the
+ * event loop.
+ */
+const compression = (threshold: number = DEFAULT_THRESHOLD) => {
+  return (req: Request, res: Response, next: NextFunction) => {
+    res.vary('Accept-Encoding');
+    const encoding = negotiateEncoding(req.headers['accept-encoding']);
+    if (!encoding) return next();
+
+    const originalJson = res.json.bind(res);
+    res.json = (data: unknown): Response => {
+      if (res.getHeader('Content-Encoding')) return originalJson(data);
+
+      // Serialised once, with the app's json replacer, spaces and escape
+      // settings, so the plain and compressed paths send the same JSON.
+      const json = stringify(req, data);
+      if (!res.getHeader('Content-Type')) res.type('json');
+      const body = Buffer.from(json, 'utf-8');
+      if (body.length < threshold) return res.send(json);
+
+      compressBody(body, encoding, (err, compressed) => {
+        if (err) {
+          console.error('Error compressing response:', err);
+          res.send(json);
+          return;
+        }
+        res.setHeader('Content-Encoding', encoding);
+        res.setHeader('Content-Length', compressed.length);
+        res.send(compressed);
+      });
+      return res;
+    };
+    next();
+  };
+};
+
+export default compression;
@@ -0,0 +1,129 @@
+import gzip
+import json
+import os
+import statistics
+import sys
+import time
+
+import requests
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+BLUE = "\033[93m"
+
+BASE_URL = os.environ.get("AREA_BACKEND_URL", "https://backend.nduboi.fr")
+
+# Baseline payload sizes in bytes, per endpoint and per encoding.
+# Reconstructed offline from the service definitions in
+# src/services/services/*, serialised like the routes do, and compressed
+# with the settings of src/middleware/compression.ts (brotli quality 5,
+# gzip level 6), without a seeded account's subscriptions. Re-record them
+# from compression_report.json after a run against a seeded backend
+# whenever the catalogue changes on purpose.
+BASELINES = {
+    "/about.json": {"identity": 12705, "gzip": 4180, "br": 3993},
+    "/api/services": {"identity": 9674, "gzip": 3023, "br": 2906},
+    "/api/services/actions": {"identity": 52249, "gzip": 5656, "br": 5356},
+    "/api/services/reactions": {"identity": 27886, "gzip": 4483, "br": 4249},
+}
+
+# Allowed growth over the baseline before a payload is reported as bloated.
+# Any budget can be overridden with an environment variable, e.g.
+# BUDGET_ABOUT_JSON_GZIP=5000 for ("/about.json", "gzip").
+HEADROOM = 0.2
+
+DECODE_RUNS = 50
+
+REPORT_PATH = os.environ.get(
+    "COMPRESSION_REPORT", os.path.join(os.path.dirname(os.path.abspath(__file__)), "compression_report.json"))
+
+ENCODINGS = ["identity", "gzip", "br"]
+
+# Helper to login and get token (for protected routes)
+def get_auth_token(email, password):
+    res = requests.post(f"{BASE_URL}/api/auth/login", json={"email": email, "password": password})
+    if res.status_code == 200:
+        return res.json().get("token"), res.cookies.get("auth_token")
+    return None, None
+
+def get_budget(path, encoding):
+    key = "BUDGET_" + path.strip("/").replace("/", "_").replace(".", "_").upper() + "_" + encoding.upper()
+    value = os.environ.get(key)
+    return int(value) if value else int(BASELINES[path][encoding] * (1 + HEADROOM))
+
+def decode_payload(raw, encoding):
+    if encoding == "gzip":
+        return gzip.decompress(raw)
+    if encoding == "br":
+        return brotli.decompress(raw)
+    return raw
+
+def measure_endpoint(path, encoding, headers):
+    res = requests.get(f"{BASE_URL}{path}", headers={**headers, "Accept-Encoding": encoding}, stream=True)
+    raw = res.raw.read(decode_content=False)
+    content_encoding = res.headers.get("Content-Encoding", "identity")
+    timings = []
+    for _ in range(DECODE_RUNS):
+        start = time.perf_counter()
+        decoded = decode_payload(raw, content_encoding)
+        timings.append((time.perf_counter() - start) * 1000)
+    return res, content_encoding, len(raw), len(decoded), statistics.median(timings)
+
+def test_payload_budget(numSuccess, numTests, results, path, encoding, headers):
+    name = f"payload_budget {path} [{encoding}]"
+    try:
+        budget = get_budget(path, encoding)
+        if encoding == "br" and brotli is None:
+            raise AssertionError("brotli module not installed, install it with pip install -r requirements.txt")
+        res, content_encoding, size, decoded_size, decode_ms = measure_endpoint(path, encoding, headers)
+        assert res.status_code == 200, f"status {res.status_code}"
+        if encoding != "identity" and decoded_size >= 1024:
+            assert content_encoding == encoding, f"Content-Encoding {content_encoding}, expected {encoding}"
+        results.append({"path": path, "encoding": content_encoding, "wire_bytes": size,
+                        "decoded_bytes": decoded_size, "decode_ms": round(decode_ms, 4), "budget": budget})
+        assert size <= budget, f"payload over budget: {size} > {budget} bytes"
+        print(f"Test {name}: {GREEN} OK{RESET}")
+        numSuccess += 1
+    except Exception as e:
+        print(f"Test {name}: {RED} FAILED{RESET}")
+        print("Error:", e)
+    return numSuccess, numTests + 1
+
+def print_results(results):
+    print(f"\n{'Endpoint':<26}{'Encoding':<10}{'Wire':>8}{'Decoded':>10}{'Decode ms':>11}{'Budget':>8}")
+    for row in results:
+        color = GREEN if row["wire_bytes"] <= row["budget"] else RED
+        print(f"{row['path']:<26}{row['encoding']:<10}{color}{row['wire_bytes']:>8}{RESET}"
+              f"{row['decoded_bytes']:>10}{row['decode_ms']:>11.3f}{row['budget']:>8}")
+
+def write_report(results):
+    report = {"base_url": BASE_URL, "timestamp": int(time.time()), "decode_runs": DECODE_RUNS, "results": results}
+    with open(REPORT_PATH, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {REPORT_PATH}")
+
+def run_test_compression_suite():
+    numSuccess = 0
+    numTests = 0
+    results = []
+    token, _ = get_auth_token("alice@example.com", "123456")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    for path in BASELINES:
+        for encoding in ENCODINGS:
+            numSuccess, numTests = test_payload_budget(numSuccess, numTests, results, path, encoding, headers)
+    print_results(results)
+    write_report(results)
+    print(f"\nCompression Test Summary: {GREEN}{numSuccess}{RESET}/{BLUE}{numTests}{RESET} tests passed.")
+    return numSuccess, numTests
+
+
+if __name__ == "__main__":
+    numSuccess, numTests = run_test_compression_suite()
+    sys.exit(0 if numSuccess == numTests else 1)
@@ -3,6 +3,7 @@ import health
 import auth
 import about
 import user
+import compression
 
 
 if __name__ == "__main__":
@@ -18,3 +19,6 @@ if __name__ == "__main__":
 
     print("\nRunning User Tests:")
     user.run_test_user_suite()
+
+    print("\nRunning Compression Tests:")
+    compression.run_test_compression_suite()
@@ -0,0 +1,150 @@
+import express, { Request, Response } from 'express';
+import request from 'supertest';
+import zlib from 'zlib';
+import http from 'http';
+import { AddressInfo } from 'net';
+import compression, {
+  negotiateEncoding,
+} from '../../src/middleware/compression';
+
+const buildCatalogue = (count: number) =>
+  Array.from({ length: count }, (_, i) => ({
+    id: `service_${i}`,
+    name: `Service ${i}`,
+    description: 'A repetitive catalogue entry used to test compression',
+  }));
+
+const fetchRaw = (
+  app: express.Application,
+  path: string,
+  acceptEncoding: string,
+  method: string = 'GET'
+): Promise<{ headers: http.IncomingHttpHeaders; body: Buffer }> =>
+  new Promise((resolve, reject) => {
+    const server = app.listen(0, () => {
+      const { port } = server.address() as AddressInfo;
+      http
+        .request(
+          {
+            port,
+            path,
+            method,
+            headers: { 'Accept-Encoding': acceptEncoding },
+          },
+          res => {
+            const chunks: Buffer[] = [];
+            res.on('data', (chunk: Buffer) => chunks.push(chunk));
+            res.on('end', () => {
+              server.close();
+              resolve({ headers: res.headers, body: Buffer.concat(chunks) });
+            });
+          }
+        )
+        .on('error', err => {
+          server.close();
+          reject(err);
+        })
+        .end();
+    });
+  });
+
+describe('Compression Middleware', () => {
+  let app: express.Application;
+
+  beforeEach(() => {
+    app = express();
+    app.use(compression());
+    app.get('/large', (req: Request, res: Response) => {
+      res.status(200).json(buildCatalogue(100));
+    });
+    app.get('/small', (req: Request, res: Response) => {
+      res.status(200).json({ status: 'OK' });
+    });
+  });
+
+  describe('negotiateEncoding', () => {
+    it('should return null when header is missing', () => {
+      expect(negotiateEncoding(undefined)).toBeNull();
+      expect(negotiateEncoding('')).toBeNull();
+    });
+
+    it('should prefer brotli over gzip at equal quality', () => {
+      expect(negotiateEncoding('gzip, deflate, br')).toBe('br');
+    });
+
+    it('should respect quality values', () => {
+      expect(negotiateEncoding('br;q=0.5, gzip;q=0.8')).toBe('gzip');
+      expect(negotiateEncoding('br;q=0, gzip')).toBe('gzip');
+    });
+
+    it('should return null for unsupported encodings', () => {
+      expect(negotiateEncoding('deflate')).toBeNull();
+      expect(negotiateEncoding('identity')).toBeNull();
+    });
+
+    it('should handle wildcard', () => {
+      expect(negotiateEncoding('*')).toBe('br');
+      expect(negotiateEncoding('*;q=0')).toBeNull();
+    });
+  });
+
+  it('should gzip large JSON responses', async () => {
+    const res = await fetchRaw(app, '/large', 'gzip');
+
+    expect(res.headers['content-encoding']).toBe('gzip');
+    expect(res.headers['vary']).toContain('Accept-Encoding');
+    const decoded = JSON.parse(zlib.gunzipSync(res.body).toString('utf-8'));
+    expect(decoded).toEqual(buildCatalogue(100));
+  });
+
+  it('should brotli-compress large JSON responses', async () => {
+    const res = await fetchRaw(app, '/large', 'br');
+
+    expect(res.headers['content-encoding']).toBe('br');
+    const decoded = JSON.parse(
+      zlib.brotliDecompressSync(res.body).toString('utf-8')
+    );
+    expect(decoded).toEqual(buildCatalogue(100));
+  });
+
+  it('should send the same headers for HEAD as for GET', async () => {
+    const get = await fetchRaw(app, '/large', 'gzip');
+    const head = await fetchRaw(app, '/large', 'gzip', 'HEAD');
+
+    expect(head.headers['content-encoding']).toBe('gzip');
+    expect(head.headers['content-length']).toBe(get.headers['content-length']);
+    expect(head.body.length).toBe(0);
+  });
+
+  it('should honour the app json settings when compressing', async () => {
+    app.set('json spaces', 2);
+    const res = await fetchRaw(app, '/large', 'gzip');
+
+    expect(res.headers['content-encoding']).toBe('gzip');
+    expect(res.headers['content-type']).toContain('application/json');
+    expect(zlib.gunzipSync(res.body).toString('utf-8')).toBe(
+      JSON.stringify(buildCatalogue(100), null, 2)
+    );
+  });
+
+  it('should not compress responses below the threshold', async () => {
+    const res = await request(app)
+      .get('/small')
+      .set('Accept-Encoding', 'gzip, br');
+
+    expect(res.status).toBe(200);
+    expect(res.headers['content-encoding']).toBeUndefined();
+    expect(res.body).toEqual({ status: 'OK' });
+  });
+
+  it('should not compress when client does not accept it', async () => {
+    const res = await request(app)
+      .get('/large')
+      .set('Accept-Encoding', 'identity');
+
+    expect(res.status).toBe(200);
+    expect(res.headers['content-encoding']).toBeUndefined();
+    expect(res.headers['vary']).toContain('Accept-Encoding');
+    expect(res.body).toEqual(buildCatalogue(100));
+  });
+});